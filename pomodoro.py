@@ -14,39 +14,161 @@ Features:
 - Customizable session lengths via command-line arguments
 - Simple command-line interface showing the time remaining
 - Sound effects can be muted with --mute option
+- Keyboard controls to pause (p), skip (s) or quit (q) a session
 """
 
 import argparse
+import itertools
 import time
 import os
 import sys
 import signal
-import datetime
-import subprocess
-import shutil
+import select
+import queue
+import threading
+from collections import namedtuple
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
 
 # ANSI color codes for prettier output
-COLORS = {
-    'RESET': '\033[0m',
-    'RED': '\033[91m',
-    'GREEN': '\033[92m',
-    'YELLOW': '\033[93m',
-    'BLUE': '\033[94m',
-    'MAGENTA': '\033[95m',
-    'CYAN': '\033[96m',
-}
+RESET = '\033[0m'
+RED = '\033[91m'
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+MAGENTA = '\033[95m'
+CYAN = '\033[96m'
+
+# ANSI escape sequences for redrawing the timer in place
+CLEAR_SEQUENCE = '\033[H\033[2J'
+HOME_SEQUENCE = '\033[H'
+ERASE_LINE_SEQUENCE = '\033[K'
+
+# Footer lines shown below the progress bar
+FOOTER = "Press Ctrl+C to exit"
+KEYS_FOOTER = "Press p to pause, s to skip, q or Ctrl+C to exit"
+PAUSED_FOOTER = "Paused - press p to resume, s to skip, q or Ctrl+C to exit"
+
+# Width of the progress bar in characters
+PROGRESS_BAR_WIDTH = 30
+BAR_FULL = b'#' * PROGRESS_BAR_WIDTH
+BAR_EMPTY = b' ' * PROGRESS_BAR_WIDTH
+
+# The timer display for a session, encoded once as a mutable byte template,
+# and the slices of the fields that change between frames
+Frame = namedtuple('Frame', ['data', 'time_field', 'bar_field', 'percent_field', 'minute_digits'])
+
+# A single timer session: its length in minutes, display name, the sound events
+# played when it starts and ends, and its display color
+Session = namedtuple('Session', ['duration', 'name', 'start_sound', 'end_sound', 'color'])
+
+# Set when the user asks the timer to stop (e.g. with Ctrl+C)
+STOP_EVENT = threading.Event()
+
+# Signals that stop the timer cleanly: Ctrl+C, termination requests from kill,
+# docker stop or systemd, and the controlling terminal closing (SIGHUP, which
+# Windows doesn't have)
+STOP_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+if hasattr(signal, 'SIGHUP'):
+    STOP_SIGNALS.add(signal.SIGHUP)
+
+# Terminal file descriptor read for keyboard controls, or None when disabled
+KEYBOARD_FD = None
+# Pipe that wakes a pending keyboard wait when STOP_EVENT is set
+_WAKEUP_READ_FD = None
+_WAKEUP_WRITE_FD = None
 
 # Set to True to enable debug output, False to disable
 DEBUG = False
 MUTE_SOUNDS = False
 
-# Sound file paths - these are terminal bell codes that will work when sound files aren't available
-SOUND_WORK_START = '\a'
-SOUND_WORK_END = '\a'
-SOUND_SHORT_BREAK_START = '\a'
-SOUND_SHORT_BREAK_END = '\a'
-SOUND_LONG_BREAK_START = '\a'
-SOUND_LONG_BREAK_END = '\a'
+# Sound events; each may have a matching <event>.wav in the sounds directory
+SOUND_EVENTS = (
+    'work_start',
+    'work_end',
+    'short_break_start',
+    'short_break_end',
+    'long_break_start',
+    'long_break_end',
+)
+
+# Sound file path for each event with a sound file, filled in by main().
+# Events without one use the terminal bell.
+SOUND_FILES = {}
+
+# External WAV player, resolved once in main() since each lookup scans every
+# $PATH entry (aplay is part of ALSA, play is part of SoX; both accept -q)
+SOUND_PLAYER = None
+
+# True when there are no usable sound files, so every event uses the terminal bell
+USE_BELL_ONLY = True
+
+# Background queues for work that may block (sound players, notifiers), so the
+# timer loop never waits on them. Sounds and notifications get separate
+# workers because a Windows message box blocks until it is dismissed.
+SOUND_QUEUE = queue.Queue()
+NOTIFY_QUEUE = queue.Queue()
+_workers = {}
+
+def _run_queue(work_queue):
+    """Run queued calls one at a time, forever.
+    
+    Errors are logged rather than raised so one failing call can't kill the
+    worker and leave later calls queued forever.
+    """
+    while True:
+        func, args = work_queue.get()
+        try:
+            func(*args)
+        except Exception as e:
+            debug_print(f"Error in {func.__name__}: {e}")
+
+def dispatch(work_queue, func, *args):
+    """Run func(*args) on the background worker for work_queue.
+    
+    Workers are started on first use rather than at import time so they
+    inherit the signal mask set up by register_interrupt_handler().
+    """
+    if work_queue not in _workers:
+        worker = threading.Thread(target=_run_queue, args=(work_queue,), daemon=True)
+        worker.start()
+        _workers[work_queue] = worker
+    work_queue.put((func, args))
+
+def run_child(argv, quiet=False):
+    """Run a command to completion with STOP_SIGNALS unblocked in the child.
+    
+    Children inherit the signal mask of the thread that starts them, and
+    register_interrupt_handler() blocks STOP_SIGNALS in every thread but the
+    signal thread, so without this Ctrl+C couldn't stop a playing sound.
+    posix_spawn clears the mask without running Python code between fork and
+    exec, which preexec_fn would do (unsafe with threads, and slower).
+    
+    Args:
+        argv: Command and arguments; the command is looked up on $PATH
+        quiet: Discard the command's stderr
+    """
+    if not hasattr(os, 'posix_spawnp'):  # Windows, or Python < 3.8
+        import subprocess
+        subprocess.call(argv, stderr=subprocess.DEVNULL if quiet else None)
+        return
+    
+    file_actions = [(os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)] if quiet else []
+    pid = os.posix_spawnp(argv[0], argv, os.environ,
+                          file_actions=file_actions, setsigmask=())
+    os.waitpid(pid, 0)
+
+def _play_file(sound):
+    """Play a sound file with the external player, blocking until it ends."""
+    try:
+        run_child([SOUND_PLAYER, '-q', sound], quiet=True)
+    except OSError as e:
+        debug_print(f"Error playing sound: {e}")
+        print('\a', end='', flush=True)  # Fallback to terminal bell
 
 def play_sound(sound_type):
     """Play a sound effect based on the type of event.
@@ -60,47 +182,33 @@ def play_sound(sound_type):
     
     debug_print(f"Playing sound for event: {sound_type}")
     
-    # Map of sound types to their respective sound files/codes
-    sound_map = {
-        'work_start': SOUND_WORK_START,
-        'work_end': SOUND_WORK_END,
-        'short_break_start': SOUND_SHORT_BREAK_START,
-        'short_break_end': SOUND_SHORT_BREAK_END,
-        'long_break_start': SOUND_LONG_BREAK_START,
-        'long_break_end': SOUND_LONG_BREAK_END
-    }
-    
-    sound = sound_map.get(sound_type, '\a')  # Default to terminal bell
-    
-    # Check if the sound is a terminal bell code
-    if sound == '\a':
+    sound = None if USE_BELL_ONLY else SOUND_FILES.get(sound_type)
+    if sound is None:
         debug_print("Using terminal bell")
-        print(sound, end='', flush=True)
+        print('\a', end='', flush=True)
         return
     
-    # Try to play the sound file using various available players
-    try:
-        if shutil.which('aplay'):
-            debug_print(f"Playing sound with aplay: {sound}")
-            subprocess.run(['aplay', '-q', sound], stderr=subprocess.DEVNULL)
-        elif shutil.which('play'):  # Part of SoX
-            debug_print(f"Playing sound with play (sox): {sound}")
-            subprocess.run(['play', '-q', sound], stderr=subprocess.DEVNULL)
-        else:
-            debug_print("No sound player found, using terminal bell")
-            print('\a', end='', flush=True)
-    except Exception as e:
-        debug_print(f"Error playing sound: {e}")
-        print('\a', end='', flush=True)  # Fallback to terminal bell
+    # Play the sound file in the background so the timer keeps running
+    debug_print(f"Playing sound with {SOUND_PLAYER}: {sound}")
+    dispatch(SOUND_QUEUE, _play_file, sound)
 
-def debug_print(message):
-    """Print debug messages if DEBUG is True."""
-    if DEBUG:
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        print(f"{COLORS['CYAN']}[DEBUG {timestamp}] {message}{COLORS['RESET']}")
+def _debug_print(message):
+    """Print a timestamped debug message."""
+    import datetime
+    timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    # Flush so debug output stays ordered with frames written by os.write()
+    print(f"{CYAN}[DEBUG {timestamp}] {message}{RESET}", flush=True)
+
+def _noop(*args, **kwargs):
+    """Discard debug messages while debug output is disabled."""
+
+# Rebound to _debug_print by parse_arguments() when --debug is given. Hot-path
+# callers should also check DEBUG first so the message isn't even formatted.
+debug_print = _noop
 
 def parse_arguments():
     """Parse command line arguments."""
+    global DEBUG, debug_print
     debug_print("Entering parse_arguments()")
     parser = argparse.ArgumentParser(description='A simple Pomodoro timer.')
     parser.add_argument('--work', type=int, default=25,
@@ -118,9 +226,9 @@ def parse_arguments():
     args = parser.parse_args()
     
     # Set DEBUG flag if --debug argument is provided
-    global DEBUG
     if args.debug:
         DEBUG = True
+        debug_print = _debug_print
         debug_print("Debug mode enabled")
     
     global MUTE_SOUNDS
@@ -135,111 +243,352 @@ def clear_screen():
     """Clear the terminal screen."""
     debug_print("Clearing screen")
     if not DEBUG:  # Skip clearing screen in debug mode to preserve debug messages
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+
+def _notify_macos(title, message):
+    """Show a notification with osascript."""
+    # AppleScript string literals only need backslashes and double quotes escaped
+    def quote(text):
+        return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    script = f"display notification {quote(message)} with title {quote(title)}"
+    run_child(['osascript', '-e', script])
+
+def _notify_linux(title, message):
+    """Show a notification with notify-send."""
+    run_child(['notify-send', title, message])
+
+def _notify_windows(title, message):
+    """Show a message box with PowerShell."""
+    import subprocess
+    # This is a simple implementation for Windows notifications
+    # For more robust notifications, consider using the win10toast package
+    def quote(text):
+        return "'" + text.replace("'", "''") + "'"
+    subprocess.call(['powershell', '-Command', f"""[System.Reflection.Assembly]::LoadWithPartialName('System.Windows.Forms')
+          [System.Windows.Forms.MessageBox]::Show({quote(message)}, {quote(title)})"""])
+
+def _notify_unsupported(title, message):
+    """Ignore notifications on platforms without a known notifier."""
+
+def _pick_notifier():
+    """Return the notification function for the current platform."""
+    if sys.platform == 'darwin':  # macOS
+        return _notify_macos
+    if sys.platform.startswith('linux'):  # Linux
+        return _notify_linux
+    if os.name == 'nt':  # Windows
+        return _notify_windows
+    return _notify_unsupported
+
+# Platform notifier, resolved once at import time
+_NOTIFY = _pick_notifier()
 
 def send_notification(title, message):
-    """Send a system notification."""
+    """Send a system notification without blocking the caller.
+    
+    Notifiers are started with an argument list rather than through a shell,
+    so the title and message are never interpreted as shell syntax.
+    """
     debug_print(f"Sending notification - Title: '{title}', Message: '{message}'")
-    if sys.platform == 'darwin':  # macOS
-        os.system(f"""osascript -e 'display notification "{message}" with title "{title}"'""")
-    elif sys.platform.startswith('linux'):  # Linux
-        os.system(f"""notify-send "{title}" "{message}" """)
-    elif os.name == 'nt':  # Windows
-        # This is a simple implementation for Windows notifications
-        # For more robust notifications, consider using the win10toast package
-        from subprocess import call
-        call(['powershell', '-Command', f"""[System.Reflection.Assembly]::LoadWithPartialName('System.Windows.Forms')
-              [System.Windows.Forms.MessageBox]::Show('{message}', '{title}')"""])
+    dispatch(NOTIFY_QUEUE, _NOTIFY, title, message)
 
 def format_time(seconds):
     """Format seconds into mm:ss format."""
     minutes, seconds = divmod(seconds, 60)
     return f"{minutes:02d}:{seconds:02d}"
 
-def display_timer(session_type, remaining_seconds, total_seconds):
-    """Display the timer with a progress bar."""
-    debug_print(f"Displaying timer - Session: {session_type}, Remaining: {remaining_seconds}s, Total: {total_seconds}s")
-    clear_screen()
-    if session_type == "Work":
-        color = COLORS['RED']
-    elif session_type == "Short Break":
-        color = COLORS['GREEN']
-    else:  # Long Break
-        color = COLORS['BLUE']
-    
-    # Calculate progress bar
-    width = 30
-    progress = int(width * (total_seconds - remaining_seconds) / total_seconds)
-    bar = f"[{'#' * progress}{' ' * (width - progress)}]"
-    
-    print(f"\n{color}=== POMODORO TIMER ==={COLORS['RESET']}")
-    print(f"\n{color}Session: {session_type}{COLORS['RESET']}")
-    print(f"\nTime Remaining: {color}{format_time(remaining_seconds)}{COLORS['RESET']}")
-    print(f"\n{bar} {int((total_seconds - remaining_seconds) / total_seconds * 100)}%")
-    print("\nPress Ctrl+C to exit\n")
-
-def run_timer(duration_minutes, session_type):
-    """Run a timer for the specified duration."""
+def build_header(session_type, color):
+    """Build the static header shown above the timer for a session."""
+    return (f"\n{color}=== POMODORO TIMER ==={RESET}\n"
+            f"\n{color}Session: {session_type}{RESET}")
+
+def build_frame(header, color, total_seconds, footer):
+    """Encode the timer display for a session into a Frame template.
+    
+    Every field has a fixed width for the whole session (the minutes are
+    space-padded to fit the session length), so display_timer() can overwrite
+    them in place.
+    """
+    minute_digits = max(2, len(str(total_seconds // 60)))
+    # Skip redrawing in place in debug mode to preserve debug messages
+    prefix = '' if DEBUG else HOME_SEQUENCE
+    
+    data = bytearray(f"{prefix}{header}\n\nTime Remaining: {color}".encode())
+    time_field = slice(len(data), len(data) + minute_digits + 3)
+    data += b' ' * (minute_digits + 3)
+    data += f"{RESET}\n\n[".encode()
+    bar_field = slice(len(data), len(data) + PROGRESS_BAR_WIDTH)
+    data += BAR_EMPTY
+    data += b"] "
+    percent_field = slice(len(data), len(data) + 3)
+    data += b"  0"
+    data += f"%\n\n{footer}{ERASE_LINE_SEQUENCE}\n".encode()
+    return Frame(data, time_field, bar_field, percent_field, minute_digits)
+
+def display_timer(frame, remaining_seconds, total_seconds):
+    """Display the timer with a progress bar.
+    
+    Overwrites the changing fields of the session's frame template and writes
+    it straight to the terminal, bypassing sys.stdout. Frames start with a
+    cursor-home sequence and redraw over the previous frame, which has the
+    same shape.
+    """
+    elapsed = total_seconds - remaining_seconds
+    progress = elapsed * PROGRESS_BAR_WIDTH // total_seconds
+    minutes, seconds = divmod(remaining_seconds, 60)
+    
+    data = frame.data
+    # Same mm:ss text as format_time(), space-padded to the field width
+    data[frame.time_field] = b'%*s' % (frame.minute_digits + 3, b'%02d:%02d' % (minutes, seconds))
+    data[frame.bar_field] = BAR_FULL[:progress] + BAR_EMPTY[progress:]
+    data[frame.percent_field] = b'%3d' % (elapsed * 100 // total_seconds)
+    
+    try:
+        fd = sys.stdout.fileno()
+        written = os.write(fd, data)
+        while written < len(data):  # Finish a partial write
+            written += os.write(fd, data[written:])
+    except OSError:
+        # The terminal is gone (e.g. hung up, or a closed pipe); nothing more
+        # can be shown, so discard further output and stop the timer
+        discard_output()
+        request_stop()
+
+def build_schedule(work, short_break, long_break, pomodoros):
+    """Return an endless iterator over the sessions of the pomodoro cycle.
+    
+    Each cycle is `pomodoros` work sessions separated by short breaks and
+    followed by a long break.
+    """
+    work_session = Session(work, "Work", 'work_start', 'work_end', RED)
+    short_session = Session(short_break, "Short Break",
+                            'short_break_start', 'short_break_end', GREEN)
+    long_session = Session(long_break, "Long Break",
+                           'long_break_start', 'long_break_end', BLUE)
+    cycle = [work_session, short_session] * (pomodoros - 1) + [work_session, long_session]
+    return itertools.cycle(cycle)
+
+def run_timer(session):
+    """Run a timer for the given session."""
+    duration_minutes = session.duration
+    session_type = session.name
     debug_print(f"Entering run_timer() - Duration: {duration_minutes}m, Session: {session_type}")
     duration_seconds = duration_minutes * 60
-    end_time = time.time() + duration_seconds
-    debug_print(f"Timer set - End time: {datetime.datetime.fromtimestamp(end_time).strftime('%H:%M:%S')}")
+    # Use the monotonic clock so wall-clock adjustments don't skew the countdown
+    end_time = time.monotonic() + duration_seconds
+    if DEBUG:
+        debug_print(f"Timer set - End time: {time.strftime('%H:%M:%S', time.localtime(time.time() + duration_seconds))}")
     
-    # Notify session start
     # Notify session start
     send_notification("Pomodoro Timer", f"{session_type} session started")
-    print(f"\n{COLORS['YELLOW']}Starting {session_type} session ({duration_minutes} minutes){COLORS['RESET']}")
+    print(f"\n{YELLOW}Starting {session_type} session ({duration_minutes} minutes){RESET}")
     debug_print(f"{session_type} session officially started")
     
     # Play sound for session start
-    if session_type == "Work":
-        play_sound('work_start')
-    elif session_type == "Short Break":
-        play_sound('short_break_start')
-    elif session_type == "Long Break":
-        play_sound('long_break_start')
-    
-    time.sleep(1)  # Small pause to read the message
-    try:
-        while time.time() < end_time:
-            current_time = time.time()
-            remaining_seconds = int(end_time - current_time)
-            
-            # Log every 30 seconds or on the last second
-            if remaining_seconds % 30 == 0 or remaining_seconds <= 1:
+    play_sound(session.start_sound)
+    
+    # Build the parts of the display that don't change during the session
+    color = session.color
+    header = build_header(session_type, color)
+    footer = FOOTER if KEYBOARD_FD is None else KEYS_FOOTER
+    frame = build_frame(header, color, duration_seconds, footer)
+    
+    STOP_EVENT.wait(1)  # Small pause to read the message
+    # Start on a clean screen; this also flushes sys.stdout before frames are
+    # written directly to the terminal
+    clear_screen()
+    sys.stdout.flush()
+    last_remaining = None
+    last_progress = None
+    tick = 0
+    skipped = False
+    while not STOP_EVENT.is_set():
+        # Read the clock once per iteration
+        now = time.monotonic()
+        if now >= end_time:
+            break
+        remaining_seconds = int(end_time - now)
+        progress = (duration_seconds - remaining_seconds) * PROGRESS_BAR_WIDTH // duration_seconds
+        
+        # Only redraw when the displayed time or progress bar changes
+        if remaining_seconds != last_remaining or progress != last_progress:
+            # Log every 30 redraws or on the last second
+            tick += 1
+            if DEBUG and (tick % 30 == 0 or remaining_seconds <= 1):
                 debug_print(f"Timer update - Remaining: {format_time(remaining_seconds)}")
-                
-            display_timer(session_type, remaining_seconds, duration_seconds)
-            time.sleep(1)
+            
+            display_timer(frame, remaining_seconds, duration_seconds)
+            last_remaining = remaining_seconds
+            last_progress = progress
+        
+        # Sleep until the displayed second changes or a key is pressed; ticks
+        # are anchored to the deadline rather than the previous wakeup so
+        # they never drift
+        next_tick = end_time - remaining_seconds
+        key = wait_for_key(max(0, next_tick - time.monotonic()))
+        
+        if key == 'p':
+            debug_print(f"{session_type} session paused")
+            paused_at = time.monotonic()
+            paused_frame = build_frame(header, color, duration_seconds, PAUSED_FOOTER)
+            display_timer(paused_frame, remaining_seconds, duration_seconds)
+            key = None
+            while key not in ('p', 's', 'q') and not STOP_EVENT.is_set():
+                key = wait_for_key(None)
+            # Push the deadline back by the time spent paused
+            end_time += time.monotonic() - paused_at
+            last_progress = None  # Redraw to replace the paused footer
+            debug_print(f"{session_type} session resumed")
         
+        if key == 'q':
+            request_stop()
+        elif key == 's':
+            skipped = True
+            break
+    
+    if STOP_EVENT.is_set():
+        try:
+            debug_print(f"{session_type} session interrupted by user")
+            clear_screen()
+            print(f"\n{YELLOW}Timer stopped.{RESET}", flush=True)
+        except OSError:
+            # The terminal is gone (e.g. after SIGHUP); discard any further
+            # output so exiting doesn't fail while flushing it
+            discard_output()
+        sys.exit(0)
+    
+    if skipped:
+        debug_print(f"{session_type} session skipped by user")
+        clear_screen()
+        print(f"\n{YELLOW}{session_type} session skipped.{RESET}")
+    else:
         # Notify session end
         debug_print(f"{session_type} session completed normally")
         clear_screen()
-        print(f"\n{COLORS['YELLOW']}{session_type} session completed!{COLORS['RESET']}")
+        print(f"\n{YELLOW}{session_type} session completed!{RESET}")
         send_notification("Pomodoro Timer", f"{session_type} session completed!")
         
         # Play sound for session end
-        if session_type == "Work":
-            play_sound('work_end')
-        elif session_type == "Short Break":
-            play_sound('short_break_end')
-        elif session_type == "Long Break":
-            play_sound('long_break_end')
-        
-    except KeyboardInterrupt:
-        debug_print(f"{session_type} session interrupted by user")
-        clear_screen()
-        print(f"\n{COLORS['YELLOW']}Timer stopped.{COLORS['RESET']}")
-        sys.exit(0)
-    finally:
-        debug_print(f"Exiting run_timer() - Session: {session_type}")
+        play_sound(session.end_sound)
+    
+    debug_print(f"Exiting run_timer() - Session: {session_type}")
+
+def wait_for_interrupt():
+    """Wait for a stop signal on a dedicated thread and ask the timer to stop.
+    
+    STOP_SIGNALS are blocked in every other thread, so the main loop never
+    runs inside an asynchronous signal handler and only has to check
+    STOP_EVENT.
+    """
+    sig = signal.sigwait(STOP_SIGNALS)
+    # Stop before logging, which fails if the terminal has hung up
+    request_stop()
+    debug_print(f"Signal thread received signal {sig}")
 
 def handle_interrupt(sig, frame):
-    """Handle keyboard interrupt."""
-    debug_print(f"Signal handler called with signal {sig}")
-    clear_screen()
-    print(f"\n{COLORS['YELLOW']}Timer stopped.{COLORS['RESET']}")
-    sys.exit(0)
+    """Handle stop signals on platforms without sigwait support."""
+    request_stop()
+
+def request_stop():
+    """Ask the timer to stop, waking it if it is waiting for a key press."""
+    STOP_EVENT.set()
+    if _WAKEUP_WRITE_FD is not None:
+        os.write(_WAKEUP_WRITE_FD, b'\0')
+
+def register_interrupt_handler():
+    """Route STOP_SIGNALS to STOP_EVENT instead of exiting abruptly."""
+    # Leave signals the process inherited as ignored (nohup, trap '' HUP, or
+    # SIGINT for background jobs of non-interactive shells) ignored: a blocked
+    # signal is still queued for sigwait even when its disposition is SIG_IGN
+    for sig in list(STOP_SIGNALS):
+        if signal.getsignal(sig) is signal.SIG_IGN:
+            STOP_SIGNALS.discard(sig)
+            debug_print(f"Leaving ignored signal {sig.name} ignored")
+    if not STOP_SIGNALS:
+        return
+    
+    if hasattr(signal, 'pthread_sigmask'):
+        # Block the signals before any other thread starts so they all inherit the mask
+        signal.pthread_sigmask(signal.SIG_BLOCK, STOP_SIGNALS)
+        threading.Thread(target=wait_for_interrupt, daemon=True).start()
+        debug_print(f"Started signal thread for {', '.join(sig.name for sig in sorted(STOP_SIGNALS))}")
+    else:  # Windows
+        for sig in STOP_SIGNALS:
+            signal.signal(sig, handle_interrupt)
+        debug_print(f"Registered signal handler for {', '.join(sig.name for sig in sorted(STOP_SIGNALS))}")
+
+def enable_keyboard_controls():
+    """Put the terminal in cbreak mode so single key presses reach the timer.
+    
+    Returns:
+        The previous terminal settings to pass to restore_terminal(), or None
+        if keyboard controls are unavailable (not a terminal, running in the
+        background, or Windows).
+    """
+    global KEYBOARD_FD, _WAKEUP_READ_FD, _WAKEUP_WRITE_FD
+    if termios is None or not sys.stdin.isatty():
+        debug_print("Keyboard controls unavailable")
+        return None
+    
+    fd = sys.stdin.fileno()
+    # Changing terminal settings from a background job (e.g. `./pomodoro.py &`)
+    # would stop the process with SIGTTOU
+    if os.tcgetpgrp(fd) != os.getpgrp():
+        debug_print("Running in the background, keyboard controls disabled")
+        return None
+    
+    settings = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    _WAKEUP_READ_FD, _WAKEUP_WRITE_FD = os.pipe()
+    KEYBOARD_FD = fd
+    debug_print("Keyboard controls enabled")
+    return settings
+
+def discard_output():
+    """Send everything written to stdout from now on to the null device."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+def restore_terminal(settings):
+    """Restore terminal settings saved by enable_keyboard_controls()."""
+    if settings is None:
+        return
+    try:
+        termios.tcsetattr(KEYBOARD_FD, termios.TCSADRAIN, settings)
+        debug_print("Terminal settings restored")
+    except termios.error as e:
+        # The terminal may already be gone, e.g. after SIGHUP
+        debug_print(f"Could not restore terminal settings: {e}")
+
+def wait_for_key(timeout):
+    """Wait for a key press, the timeout, or a stop request.
+    
+    Args:
+        timeout: Seconds to wait, or None to wait indefinitely
+    
+    Returns:
+        The lower-cased key that was pressed, or None if none was.
+    """
+    if KEYBOARD_FD is None:
+        STOP_EVENT.wait(timeout)
+        return None
+    
+    ready, _, _ = select.select([KEYBOARD_FD, _WAKEUP_READ_FD], [], [], timeout)
+    if KEYBOARD_FD not in ready:
+        return None
+    
+    try:
+        key = os.read(KEYBOARD_FD, 1)
+    except OSError:
+        key = b''
+    if not key:
+        # A hung-up terminal stays readable but returns nothing; stop rather
+        # than spin on it
+        request_stop()
+        return None
+    return key.decode(errors='ignore').lower()
 
 def main():
     """Main function to run the Pomodoro timer."""
@@ -247,80 +596,43 @@ def main():
     args = parse_arguments()
     
     # Register signal handler for clean exits
-    signal.signal(signal.SIGINT, handle_interrupt)
-    debug_print("Registered signal handler for SIGINT")
+    register_interrupt_handler()
     
     # Set up custom sound files if they exist in the same directory
-    global SOUND_WORK_START, SOUND_WORK_END
-    global SOUND_SHORT_BREAK_START, SOUND_SHORT_BREAK_END
-    global SOUND_LONG_BREAK_START, SOUND_LONG_BREAK_END
-    
+    global SOUND_PLAYER, USE_BELL_ONLY
     sound_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds")
     
     if os.path.isdir(sound_dir):
         debug_print(f"Found sounds directory: {sound_dir}")
+        import shutil
+        SOUND_PLAYER = shutil.which('aplay') or shutil.which('play')
+        debug_print(f"Sound player: {SOUND_PLAYER}")
         
-        work_start = os.path.join(sound_dir, "work_start.wav")
-        if os.path.isfile(work_start):
-            SOUND_WORK_START = work_start
-            debug_print(f"Using custom sound for work start: {work_start}")
-            
-        work_end = os.path.join(sound_dir, "work_end.wav")
-        if os.path.isfile(work_end):
-            SOUND_WORK_END = work_end
-            debug_print(f"Using custom sound for work end: {work_end}")
-            
-        short_break_start = os.path.join(sound_dir, "short_break_start.wav")
-        if os.path.isfile(short_break_start):
-            SOUND_SHORT_BREAK_START = short_break_start
-            debug_print(f"Using custom sound for short break start: {short_break_start}")
-            
-        short_break_end = os.path.join(sound_dir, "short_break_end.wav")
-        if os.path.isfile(short_break_end):
-            SOUND_SHORT_BREAK_END = short_break_end
-            debug_print(f"Using custom sound for short break end: {short_break_end}")
-            
-        long_break_start = os.path.join(sound_dir, "long_break_start.wav")
-        if os.path.isfile(long_break_start):
-            SOUND_LONG_BREAK_START = long_break_start
-            debug_print(f"Using custom sound for long break start: {long_break_start}")
-            
-        long_break_end = os.path.join(sound_dir, "long_break_end.wav")
-        if os.path.isfile(long_break_end):
-            SOUND_LONG_BREAK_END = long_break_end
-            debug_print(f"Using custom sound for long break end: {long_break_end}")
+        # Without a player the sound files can't be used
+        if SOUND_PLAYER:
+            for event in SOUND_EVENTS:
+                path = os.path.join(sound_dir, f"{event}.wav")
+                if os.path.isfile(path):
+                    SOUND_FILES[event] = path
+                    debug_print(f"Using custom sound for {event}: {path}")
     else:
         debug_print("No sounds directory found, using terminal bell for all sounds")
     
-    pomodoro_count = 0
+    USE_BELL_ONLY = not SOUND_FILES
+    
+    schedule = build_schedule(args.work, args.short_break, args.long_break, args.pomodoros)
+    terminal_settings = enable_keyboard_controls()
     debug_print("Starting pomodoro cycle")
     
     try:
-        while True:
-            # Work session
-            pomodoro_count += 1
-            debug_print(f"Starting pomodoro #{pomodoro_count}")
-            run_timer(args.work, "Work")
+        for session in schedule:
+            run_timer(session)
             
-            # Determine break type
-            if pomodoro_count % args.pomodoros == 0:
-                # Long break after specified number of pomodoros
-                debug_print(f"Taking long break after {args.pomodoros} pomodoros")
-                run_timer(args.long_break, "Long Break")
-            else:
-                # Short break
-                debug_print("Taking short break")
-                run_timer(args.short_break, "Short Break")
-                
-    except KeyboardInterrupt:
-        debug_print("Main loop interrupted by user")
-        clear_screen()
-        print(f"\n{COLORS['YELLOW']}Pomodoro timer stopped.{COLORS['RESET']}")
-        sys.exit(0)
     except Exception as e:
         debug_print(f"Unexpected error in main loop: {str(e)}")
         raise
     finally:
+        restore_terminal(terminal_settings)
         debug_print("Exiting main()")
 
 if __name__ == "__main__":